@@ -1,6 +1,8 @@
 from functools import wraps
-from typing import Any
+import inspect
+from typing import Any, Optional
 
+from django.db.models import OuterRef, PositiveSmallIntegerField, Subquery, Value
 from django.http import HttpResponseForbidden
 from django.http.response import HttpResponseNotFound
 from django.shortcuts import get_object_or_404
@@ -8,23 +10,52 @@ from django.shortcuts import get_object_or_404
 from multinet.api.models import Workspace, WorkspaceRole, WorkspaceRoleChoice
 
 
-def _get_workspace_and_user(*args, **kwargs):
+def _workspace_name_kwarg(func: Any) -> str:
     """
-    Determine the workspace and user from ambiguous arguments.
+    Determine which keyword argument of an API endpoint function holds the workspace name.
 
-    Helper function to get the workspace and user from the arguments
-    passed to an API endpoint function. Since different endpoints have different
-    arguments, the permission-checking decorator must be able to handle a variety of scenarios.
-    This function pulls out the workspace name passed on the keyword arguments passed in.
+    Since different endpoints have different arguments, the permission-checking decorators must be
+    able to handle a variety of scenarios. Endpoints on the children of a workspace (tables,
+    networks, etc.) receive it as `parent_lookup_workspace__name`, while endpoints on a workspace
+    itself receive it as `name`. This is determined once, when the endpoint is decorated, so that
+    decorating an endpoint which takes neither fails immediately.
     """
-    workspace_name = ''
-    if 'parent_lookup_workspace__name' in kwargs:
-        workspace_name = kwargs['parent_lookup_workspace__name']
-    elif 'name' in kwargs:
-        workspace_name = kwargs['name']
+    parameters = inspect.signature(func).parameters
+    for name_kwarg in ('parent_lookup_workspace__name', 'name'):
+        if name_kwarg in parameters:
+            return name_kwarg
 
-    workspace = get_object_or_404(Workspace.objects.select_related('owner'), name=workspace_name)
-    user = args[1].user
+    raise TypeError(
+        f'{func.__qualname__} must take a workspace name, as either '
+        '"parent_lookup_workspace__name" or "name"'
+    )
+
+
+def _get_workspace_and_user(request: Any, workspace_name: str):
+    """
+    Get the workspace with the given name, and the user of a request.
+
+    The user's role on the workspace (or None) is fetched in the same query, and set as the
+    `_user_role` attribute of the returned workspace. If a decorator has already fetched this
+    workspace during the current request, it is reused along with the user's role.
+    """
+    user = request.user
+
+    workspace = getattr(request, 'workspace', None)
+    if workspace is not None and workspace.name == workspace_name:
+        return workspace, user
+
+    # Anonymous users can't have a role, so don't look one up for them
+    if user.is_authenticated:
+        user_roles = WorkspaceRole.objects.filter(workspace=OuterRef('pk'), user=user.pk)
+        user_role = Subquery(user_roles.values('role')[:1])
+    else:
+        user_role = Value(None, output_field=PositiveSmallIntegerField())
+
+    # Ownership is checked against owner_id, so the owner itself isn't joined
+    workspace = get_object_or_404(
+        Workspace.objects.annotate(_user_role=user_role), name=workspace_name
+    )
 
     return workspace, user
 
@@ -37,26 +68,31 @@ def require_workspace_permission(minimum_permission: WorkspaceRoleChoice) -> Any
     (tables and networks) on a single workspace.
     Returns Http403 if the request's user does not have appropriate permissions,
     or Http404 if the request's user has no permissions and workspace is not public.
+    Otherwise, the fetched workspace is made available to the endpoint as `request.workspace`.
     """
+    # Resolve the permission requirements once, rather than on every request
+    minimum_role = minimum_permission.value
+    public_allowed = minimum_permission == WorkspaceRoleChoice.READER
 
     def require_permission_inner(func: Any) -> Any:
+        name_kwarg = _workspace_name_kwarg(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            workspace, user = _get_workspace_and_user(*args, **kwargs)
-            user_permission: WorkspaceRole = workspace.get_user_permission(user)
-            allow_public = workspace.public and minimum_permission == WorkspaceRoleChoice.READER
-            has_minimum_permission = (
-                user_permission is not None and user_permission.role >= minimum_permission
-            )
-
-            if allow_public or workspace.owner == user or has_minimum_permission:
+            workspace, user = _get_workspace_and_user(args[1], kwargs[name_kwarg])
+            user_role: Optional[int] = workspace._user_role
+            allow_public = public_allowed and workspace.public
+            has_minimum_permission = user_role is not None and user_role >= minimum_role
+
+            if allow_public or workspace.owner_id == user.id or has_minimum_permission:
+                args[1].workspace = workspace
                 return func(*args, **kwargs)
 
             if workspace.public:
                 return HttpResponseForbidden()
 
             # Private workspace
-            if user_permission is not None:
+            if user_role is not None:
                 return HttpResponseForbidden()
             return HttpResponseNotFound()
 
@@ -66,17 +102,23 @@ def require_workspace_permission(minimum_permission: WorkspaceRoleChoice) -> Any
 
 
 def require_workspace_ownership(func: Any) -> Any:
-    """Check a request for workspace ownership."""
+    """
+    Check a request for workspace ownership.
+
+    If the check passes, the fetched workspace is made available to the endpoint as
+    `request.workspace`.
+    """
+    name_kwarg = _workspace_name_kwarg(func)
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        workspace, user = _get_workspace_and_user(*args, **kwargs)
+        workspace, user = _get_workspace_and_user(args[1], kwargs[name_kwarg])
 
-        if workspace.owner == user:
+        if workspace.owner_id == user.id:
+            args[1].workspace = workspace
             return func(*args, **kwargs)
 
-        user_permission: WorkspaceRole = workspace.get_user_permission(user)
-        if user_permission is None:
+        if workspace._user_role is None:
             return HttpResponseNotFound()
         return HttpResponseForbidden()
 
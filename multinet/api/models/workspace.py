@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from arango.database import StandardDatabase
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, transaction
 from django.db.models.signals import post_delete, pre_save
 from django.dispatch import receiver
 from django_extensions.db.models import TimeStampedModel
@@ -37,6 +37,25 @@ class WorkspaceRole(TimeStampedModel):
         ]
 
 
+class WorkspaceQuerySet(models.QuerySet):
+    def visible_to(self, user: User) -> WorkspaceQuerySet:
+        """Filter to the workspaces which a user may read: public, owned or with any role."""
+        public_workspaces = models.Q(public=True)
+
+        # Anonymous users can only see public workspaces
+        if not user.is_authenticated:
+            return self.filter(public_workspaces)
+
+        # Use a correlated subquery rather than a join, so that no duplicate rows are produced
+        readable_private_workspaces = models.Q(
+            models.Exists(
+                WorkspaceRole.objects.filter(workspace=models.OuterRef('pk'), user_id=user.id)
+            )
+        )
+        owned_workspaces = models.Q(owner_id=user.id)
+        return self.filter(public_workspaces | readable_private_workspaces | owned_workspaces)
+
+
 class Workspace(TimeStampedModel):
     name = models.CharField(max_length=300, unique=True)
     public = models.BooleanField(default=False)
@@ -48,38 +67,45 @@ class Workspace(TimeStampedModel):
         max_length=34, unique=True, default=create_default_arango_db_name
     )
 
+    objects = WorkspaceQuerySet.as_manager()
+
     class Meta:
         ordering = ['id']
 
-    @property
-    def maintainers(self):
+    def _users_with_role(self, role: WorkspaceRoleChoice) -> List[User]:
+        # Filter a prefetched workspacerole_set in Python, rather than querying again
+        if 'workspacerole_set' in getattr(self, '_prefetched_objects_cache', {}):
+            return [
+                workspace_role.user
+                for workspace_role in self.workspacerole_set.all()
+                if workspace_role.role == role
+            ]
+
         return [
-            role.user
-            for role in WorkspaceRole.objects.select_related('user').filter(
-                workspace=self.pk, role=WorkspaceRoleChoice.MAINTAINER
+            workspace_role.user
+            for workspace_role in WorkspaceRole.objects.select_related('user').filter(
+                workspace=self.pk, role=role
             )
         ]
 
+    @property
+    def maintainers(self):
+        return self._users_with_role(WorkspaceRoleChoice.MAINTAINER)
+
     @property
     def writers(self):
-        return [
-            role.user
-            for role in WorkspaceRole.objects.select_related('user').filter(
-                workspace=self.pk, role=WorkspaceRoleChoice.WRITER
-            )
-        ]
+        return self._users_with_role(WorkspaceRoleChoice.WRITER)
 
     @property
     def readers(self):
-        return [
-            role.user
-            for role in WorkspaceRole.objects.select_related('user').filter(
-                workspace=self.pk, role=WorkspaceRoleChoice.READER
-            )
-        ]
+        return self._users_with_role(WorkspaceRoleChoice.READER)
 
     def get_user_permission(self, user: User) -> Optional[WorkspaceRole]:
         """Get the WorkspaceRole for a given user on this workspace."""
+        # Anonymous users can't have a role, so don't query for one
+        if not user.is_authenticated:
+            return None
+
         return WorkspaceRole.objects.filter(workspace=self.pk, user=user.pk).first()
 
     def get_user_permission_tuple(self, user: User) -> Union[Tuple[int, str], Tuple[None, None]]:
@@ -94,19 +120,31 @@ class Workspace(TimeStampedModel):
         owner of this workspace. Moreover, if a user has no permission on this workspace, or is the
         anonymous user (not logged in), but the workspace is public, the reader tuple is returned.
         """
-        if self.owner == user:
+        if self.owner_id == user.id:
             return 4, 'owner'
 
         workspace_role = self.get_user_permission(user)
-        if workspace_role is None:
+        role = workspace_role.role if workspace_role is not None else None
+        return self.build_user_permission_tuple(user, role)
+
+    def build_user_permission_tuple(
+        self, user: User, role: Optional[int]
+    ) -> Union[Tuple[int, str], Tuple[None, None]]:
+        """
+        Return the same tuple as get_user_permission_tuple, from an already fetched role.
+
+        This avoids querying the database, for callers which have already looked up the 'role'
+        field of the user's WorkspaceRole on this workspace (None if there is no such role).
+        """
+        if self.owner_id == user.id:
+            return 4, 'owner'
+
+        if role is None:
             if self.public:
                 return WorkspaceRoleChoice.READER.value, WorkspaceRoleChoice.READER.label
             return None, None
         else:
-            return (
-                WorkspaceRoleChoice(workspace_role.role).value,
-                WorkspaceRoleChoice(workspace_role.role).label,
-            )
+            return WorkspaceRoleChoice(role).value, WorkspaceRoleChoice(role).label
 
     def set_user_permission(self, user: User, permission: WorkspaceRoleChoice) -> bool:
         """
@@ -132,7 +170,7 @@ class Workspace(TimeStampedModel):
         # Delete existing WorkspaceRole for the new owner, if it exists
         WorkspaceRole.objects.filter(workspace=self.pk, user=new_owner).delete()
         self.owner = new_owner
-        self.save()
+        self.save(update_fields=['owner', 'modified'])
 
     def set_user_permissions_bulk(
         self,
@@ -141,8 +179,6 @@ class Workspace(TimeStampedModel):
         maintainers: Optional[List[User]] = None,
     ):
         """Replace all existing permissions on this workspace."""
-        WorkspaceRole.objects.filter(workspace=self).delete()
-
         readers = readers or []
         new_reader_roles = [
             WorkspaceRole(workspace=self, user=user, role=WorkspaceRoleChoice.READER)
@@ -161,10 +197,13 @@ class Workspace(TimeStampedModel):
             for user in maintainers
         ]
 
-        # Create all new WorkspaceRole objects in one go
-        WorkspaceRole.objects.bulk_create(
-            [*new_reader_roles, *new_writer_roles, *new_maintainer_roles]
-        )
+        # Replace the existing WorkspaceRole objects in one transaction, creating all new ones in
+        # one go, so the workspace is never left with a partial set of roles
+        with transaction.atomic():
+            WorkspaceRole.objects.filter(workspace=self).delete()
+            WorkspaceRole.objects.bulk_create(
+                [*new_reader_roles, *new_writer_roles, *new_maintainer_roles]
+            )
 
     def get_arango_db(self, readonly=True) -> StandardDatabase:
         """
@@ -182,7 +221,9 @@ class Workspace(TimeStampedModel):
 # Handle arango sync
 @receiver(pre_save, sender=Workspace)
 def arango_db_save(sender: Type[Workspace], instance: Workspace, **kwargs):
-    ensure_db_created(instance.arango_db_name)
+    # The arango db only needs creating along with the workspace, not on every later update
+    if instance._state.adding:
+        ensure_db_created(instance.arango_db_name)
 
 
 @receiver(post_delete, sender=Workspace)
@@ -79,6 +79,29 @@ def test_network_rest_list_public(
         assert arango_db.has_graph(network['name'])
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize('num_networks', [1, 5])
+def test_network_rest_list_num_queries(
+    network_factory: NetworkFactory,
+    workspace: Workspace,
+    user: User,
+    authenticated_api_client: APIClient,
+    django_assert_num_queries,
+    num_networks: int,
+):
+    """Test that listing networks takes the same number of queries, regardless of their number."""
+    workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
+    for _ in range(num_networks):
+        network_factory(workspace=workspace)
+
+    # The workspace, the user's role on it, and the page of networks
+    with django_assert_num_queries(3):
+        r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/networks/')
+
+    assert r.status_code == 200
+    assert r.json()['count'] == num_networks
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
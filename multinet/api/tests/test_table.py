@@ -78,6 +78,29 @@ def test_table_rest_list_public(
         assert arango_db.has_collection(table['name'])
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize('num_tables', [1, 5])
+def test_table_rest_list_num_queries(
+    table_factory: TableFactory,
+    workspace: Workspace,
+    user: User,
+    authenticated_api_client: APIClient,
+    django_assert_num_queries,
+    num_tables: int,
+):
+    """Test that listing tables takes the same number of queries, regardless of their number."""
+    workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
+    for _ in range(num_tables):
+        table_factory(workspace=workspace)
+
+    # The workspace, the user's role on it, and the page of tables
+    with django_assert_num_queries(3):
+        r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/tables/')
+
+    assert r.status_code == 200
+    assert r.json()['count'] == num_tables
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize('edge', [True, False])
 @pytest.mark.parametrize(
@@ -1,4 +1,5 @@
-from typing import Dict, List
+import json
+from typing import Dict, List, Optional
 
 from arango.cursor import Cursor
 from django.contrib.auth.models import User
@@ -12,8 +13,9 @@ from multinet.api.tests.factories import (
     PublicWorkspaceFactory,
     UserFactory,
 )
-from multinet.api.tests.utils import create_users_with_permissions
+from multinet.api.tests.utils import create_users_with_permissions, streaming_response_json
 from multinet.api.utils.arango import arango_system_db
+from multinet.api.views.common import STREAM_CHUNK_SIZE, _stream_json_array
 
 from .conftest import populated_table
 from .fuzzy import TIMESTAMP_RE, workspace_re
@@ -86,6 +88,44 @@ def test_workspace_rest_list_no_duplicates(
     }
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize('limit,offset', [(2, 0), (2, 2), (2, 4), (2, 6), (5, 0), (10, 0)])
+def test_workspace_rest_list_paginated(
+    public_workspace_factory: PublicWorkspaceFactory, api_client: APIClient, limit: int, offset: int
+):
+    workspace_names = [public_workspace_factory().name for _ in range(5)]
+
+    r = api_client.get('/api/workspaces/', {'limit': limit, 'offset': offset})
+    r_json = r.json()
+
+    assert r.status_code == 200
+    assert r_json['count'] == len(workspace_names)
+    assert [workspace['name'] for workspace in r_json['results']] == workspace_names[
+        offset : offset + limit
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('num_workspaces', [1, 5])
+def test_workspace_rest_list_num_queries(
+    private_workspace_factory: PrivateWorkspaceFactory,
+    user: User,
+    authenticated_api_client: APIClient,
+    django_assert_num_queries,
+    num_workspaces: int,
+):
+    """Test that listing workspaces takes the same number of queries, regardless of their number."""
+    for _ in range(num_workspaces):
+        private_workspace_factory().set_user_permission(user, WorkspaceRoleChoice.READER)
+
+    # The page isn't full, so its size gives the count without a separate query
+    with django_assert_num_queries(1):
+        r = authenticated_api_client.get('/api/workspaces/')
+
+    assert r.status_code == 200
+    assert r.json()['count'] == num_workspaces
+
+
 @pytest.mark.django_db
 def test_workspace_rest_create(authenticated_api_client: APIClient):
     fake = Faker()
@@ -203,6 +243,21 @@ def test_workspace_rest_retrieve_public(
     }
 
 
+@pytest.mark.django_db
+def test_workspace_rest_retrieve_num_queries(
+    workspace: Workspace,
+    user: User,
+    authenticated_api_client: APIClient,
+    django_assert_num_queries,
+):
+    workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
+
+    with django_assert_num_queries(1):
+        r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/')
+
+    assert r.status_code == 200
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -302,6 +357,28 @@ def test_workspace_rest_get_permissions(
         assert all(reader['username'] in reader_names for reader in r_json['readers'])
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize('num_readers', [1, 5])
+def test_workspace_rest_get_permissions_num_queries(
+    workspace: Workspace,
+    user: User,
+    user_factory: UserFactory,
+    authenticated_api_client: APIClient,
+    django_assert_num_queries,
+    num_readers: int,
+):
+    """Test that getting permissions takes the same number of queries, regardless of roles."""
+    workspace.set_owner(user)
+    workspace.set_user_permissions_bulk(readers=[user_factory() for _ in range(num_readers)])
+
+    # The workspace along with the user's role, its owner, and its roles along with their users
+    with django_assert_num_queries(3):
+        r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/permissions/')
+
+    assert r.status_code == 200
+    assert len(r.json()['readers']) == num_readers
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -368,6 +445,92 @@ def test_workspace_rest_put_permissions(
         assert workspace.owner == old_owner
 
 
+@pytest.mark.django_db
+def test_workspace_rest_put_permissions_missing_user(
+    workspace: Workspace,
+    user: User,
+    user_factory: UserFactory,
+    authenticated_api_client: APIClient,
+):
+    """Test that permissions are left unchanged if any of the given users doesn't exist."""
+    workspace.set_owner(user)
+    create_users_with_permissions(user_factory, workspace)
+    old_roles = {
+        'maintainers': set(workspace.maintainers),
+        'writers': set(workspace.writers),
+        'readers': set(workspace.readers),
+    }
+
+    request_data = {
+        'public': True,
+        'owner': {'username': user_factory().username},
+        'maintainers': [{'username': user_factory().username}],
+        'writers': [{'username': user_factory().username}],
+        'readers': [{'username': user_factory().username}, {'username': 'nonexistent'}],
+    }
+    r = authenticated_api_client.put(
+        f'/api/workspaces/{workspace.name}/permissions/', request_data, format='json'
+    )
+    assert r.status_code == 404
+
+    workspace = Workspace.objects.get(id=workspace.pk)
+    assert workspace.public is False
+    assert workspace.owner == user
+    assert set(workspace.maintainers) == old_roles['maintainers']
+    assert set(workspace.writers) == old_roles['writers']
+    assert set(workspace.readers) == old_roles['readers']
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('new_owner_role', [None, 'maintainers', 'writers', 'readers'])
+def test_workspace_rest_put_permissions_response(
+    workspace: Workspace,
+    user: User,
+    user_factory: UserFactory,
+    authenticated_api_client: APIClient,
+    new_owner_role: Optional[str],
+):
+    """Test that the response to setting permissions matches the permissions then retrieved."""
+    workspace.set_owner(user)
+
+    new_owner = user_factory()
+    roles: Dict[str, List[User]] = {
+        'maintainers': [user_factory() for _ in range(2)],
+        'writers': [user_factory() for _ in range(2)],
+        'readers': [user_factory() for _ in range(2)],
+    }
+
+    # The new owner may also be listed with another role, which ownership replaces
+    if new_owner_role is not None:
+        roles[new_owner_role].append(new_owner)
+
+    request_data = {
+        'public': False,
+        'owner': {'username': new_owner.username},
+        **{
+            field: [{'username': role_user.username} for role_user in role_users]
+            for field, role_users in roles.items()
+        },
+    }
+    r = authenticated_api_client.put(
+        f'/api/workspaces/{workspace.name}/permissions/', request_data, format='json'
+    )
+    assert r.status_code == 200
+
+    # Only the new owner may now retrieve the permissions of the workspace
+    new_owner_client = APIClient()
+    new_owner_client.force_authenticate(user=new_owner)
+    r_get = new_owner_client.get(f'/api/workspaces/{workspace.name}/permissions/')
+    assert r_get.status_code == 200
+
+    for r_json in [r.json(), r_get.json()]:
+        assert r_json['owner']['username'] == new_owner.username
+        for field, role_users in roles.items():
+            assert sorted(role_user['username'] for role_user in r_json[field]) == sorted(
+                role_user.username for role_user in role_users if role_user != new_owner
+            )
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -421,6 +584,23 @@ def test_workspace_rest_get_user_permission_public(
     }
 
 
+@pytest.mark.django_db
+def test_workspace_rest_get_user_permission_num_queries(
+    workspace: Workspace,
+    user: User,
+    authenticated_api_client: APIClient,
+    django_assert_num_queries,
+):
+    workspace.set_user_permission(user, WorkspaceRoleChoice.WRITER)
+
+    # The permission found while fetching the workspace is reused for the response
+    with django_assert_num_queries(1):
+        r = authenticated_api_client.get(f'/api/workspaces/{workspace.name}/permissions/me/')
+
+    assert r.status_code == 200
+    assert r.json()['permission'] == WorkspaceRoleChoice.WRITER.value
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     'permission,is_owner,status_code,success',
@@ -464,11 +644,90 @@ def test_workspace_rest_aql(
     assert r.status_code == status_code
 
     if success:
-        results = r.json()
+        results = streaming_response_json(r)
         for node in nodes_list:
             assert node in results
 
 
+@pytest.mark.parametrize('num_docs', [0, 1, 2 * STREAM_CHUNK_SIZE + 1])
+def test_stream_json_array(num_docs: int):
+    """Test that streamed documents form a JSON array, across any number of chunks."""
+    docs = [{'_key': str(i), 'value': i} for i in range(num_docs)]
+    assert json.loads(''.join(_stream_json_array(iter(docs)))) == docs
+
+
+@pytest.mark.django_db
+def test_workspace_rest_aql_paginated(
+    workspace: Workspace, user: User, authenticated_api_client: APIClient
+):
+    workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
+    node_table = populated_table(workspace, False)
+    nodes_list = sorted(node_table.get_rows(), key=lambda doc: doc['_key'])
+
+    r = authenticated_api_client.post(
+        f'/api/workspaces/{workspace.name}/aql/',
+        {
+            'query': 'FOR doc IN @@TABLE SORT doc._key RETURN doc',
+            'bind_vars': {
+                '@TABLE': node_table.name,
+            },
+            'limit': 2,
+            'offset': 1,
+        },
+        format='json',
+    )
+    assert r.status_code == 200
+    assert streaming_response_json(r) == nodes_list[1:3]
+
+
+@pytest.mark.django_db
+def test_workspace_rest_aql_paginated_trailing_comment(
+    workspace: Workspace, user: User, authenticated_api_client: APIClient
+):
+    workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
+    node_table = populated_table(workspace, False)
+    nodes_list = sorted(node_table.get_rows(), key=lambda doc: doc['_key'])
+
+    r = authenticated_api_client.post(
+        f'/api/workspaces/{workspace.name}/aql/',
+        {
+            'query': 'FOR doc IN @@TABLE SORT doc._key RETURN doc // all nodes',
+            'bind_vars': {
+                '@TABLE': node_table.name,
+            },
+            'limit': 2,
+        },
+        format='json',
+    )
+    assert r.status_code == 200
+    assert streaming_response_json(r) == nodes_list[:2]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'page',
+    [{'offset': 1}, {'limit': 0}, {'limit': -1}, {'limit': 2, 'offset': -1}],
+)
+def test_workspace_rest_aql_paginated_invalid(
+    workspace: Workspace, user: User, authenticated_api_client: APIClient, page: Dict[str, int]
+):
+    workspace.set_user_permission(user, WorkspaceRoleChoice.READER)
+    node_table = populated_table(workspace, False)
+
+    r = authenticated_api_client.post(
+        f'/api/workspaces/{workspace.name}/aql/',
+        {
+            'query': 'FOR doc IN @@TABLE RETURN doc',
+            'bind_vars': {
+                '@TABLE': node_table.name,
+            },
+            **page,
+        },
+        format='json',
+    )
+    assert r.status_code == 400
+
+
 @pytest.mark.django_db
 def test_workspace_rest_aql_mutating_query(
     workspace: Workspace, user: User, authenticated_api_client: APIClient
@@ -1,6 +1,8 @@
-from typing import Dict, List, Optional
+import json
+from typing import Any, Dict, List, Optional
 
 from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
 from rest_framework.test import APIClient
 
 from multinet.api.models import Workspace, WorkspaceRoleChoice
@@ -23,6 +25,11 @@ def generate_arango_documents(n: int, num_fields: int = 3) -> List[Dict]:
     return [{f'foo{i}_{ii}': f'bar{i}_{ii}' for ii in range(num_fields)} for i in range(n)]
 
 
+def streaming_response_json(response: StreamingHttpResponse) -> Any:
+    """Consume a streaming response, returning its decoded JSON content."""
+    return json.loads(b''.join(response.streaming_content))
+
+
 def assert_limit_offset_results(
     client: APIClient, url: str, result: List, params: Optional[Dict] = None
 ):
@@ -23,6 +23,8 @@ def arango_client():
     return ArangoClient(hosts=settings.MULTINET_ARANGO_URL, http_client=NoTimeoutHttpClient())
 
 
+# Database handles are cheap to reuse, as all of them share the client's HTTP sessions
+@lru_cache(maxsize=128)
 def db(name: str, readonly):
     username = 'readonly' if readonly else 'root'
     password = (
@@ -130,7 +132,8 @@ class ArangoQuery:
         if not limit and not offset:
             return ArangoQuery(self.db, query_str=self.query_str, bind_vars=self.bind_vars)
 
-        new_query_str = f'FOR doc IN ({self.query_str}) LIMIT {offset}, {limit} RETURN doc'
+        # The newline ends any trailing line comment in the wrapped query
+        new_query_str = f'FOR doc IN ({self.query_str}\n) LIMIT {offset}, {limit} RETURN doc'
         return ArangoQuery(self.db, query_str=new_query_str, bind_vars=self.bind_vars)
 
     def execute(self, asynchronous=False, **kwargs) -> Cursor:
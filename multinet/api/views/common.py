@@ -1,8 +1,10 @@
-from typing import Dict, List
+import json
+from typing import Dict, Iterator, List
 
 from arango.cursor import Cursor
-from django.http.response import Http404
+from django.http.response import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from more_itertools import chunked
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework_extensions.mixins import NestedViewSetMixin
@@ -14,6 +16,66 @@ from multinet.api.utils.arango import ArangoQuery
 class MultinetPagination(LimitOffsetPagination):
     default_limit = 100
 
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate a queryset, only counting its results when necessary.
+
+        If the requested page isn't full, the total count follows from its offset and size, so
+        the COUNT query is only made when there may be further results beyond this page.
+        """
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        self.request = request
+
+        page = list(queryset[self.offset : self.offset + self.limit])
+        if len(page) < self.limit and (page or not self.offset):
+            self.count = self.offset + len(page)
+        else:
+            self.count = self.get_count(queryset)
+
+        if self.count > self.limit and self.template is not None:
+            self.display_page_controls = True
+
+        return page
+
+
+# Matches arango's default cursor batch size, so that each fetched batch is written at once
+STREAM_CHUNK_SIZE = 1000
+
+# Batches are only fetched as fast as the client reads them, so streamed cursors are kept alive
+# for longer than arango's default of 30 seconds between fetches
+STREAM_CURSOR_TTL_SECS = 300
+
+
+def _stream_json_array(cursor: Cursor) -> Iterator[str]:
+    yield '['
+    separator = ''
+    for docs in chunked(cursor, STREAM_CHUNK_SIZE):
+        yield separator + ','.join(json.dumps(doc) for doc in docs)
+        separator = ','
+    yield ']'
+
+
+def stream_cursor(cursor: Cursor, **kwargs) -> StreamingHttpResponse:
+    """
+    Return a response which streams the documents of an arango cursor as a JSON array.
+
+    The cursor fetches further batches from arango as it's consumed, so the full result set is
+    never held in memory at once, and each batch is written to the response as a single chunk.
+    Keyword arguments are passed to `StreamingHttpResponse`.
+
+    Since the status is sent before streaming begins, an error fetching a later batch can't be
+    reported through it. The response is cut short instead, leaving an unterminated JSON array.
+    This includes the cursor expiring, so cursors to be streamed should be created with a `ttl` of
+    `STREAM_CURSOR_TTL_SECS`.
+    """
+    return StreamingHttpResponse(
+        _stream_json_array(cursor), content_type='application/json', **kwargs
+    )
+
 
 class ArangoPagination(LimitOffsetPagination):
     """Override the LimitOffsetPagination class to allow for use with arango cursors."""
@@ -77,9 +139,15 @@ class WorkspaceChildMixin(NestedViewSetMixin):
             return child_objects.none()
 
         parent_query_dict = self.get_parents_query_dict()
-        workspace = get_object_or_404(
-            Workspace.objects.select_related('owner'), name=parent_query_dict[self.workspace_field]
-        )
+        workspace_name = parent_query_dict[self.workspace_field]
+
+        # Endpoints wrapped in a permission decorator have already fetched the workspace, and
+        # checked that the user may access it
+        checked_workspace = getattr(self.request, 'workspace', None)
+        if checked_workspace is not None and checked_workspace.name == workspace_name:
+            return child_objects
+
+        workspace = get_object_or_404(Workspace, name=workspace_name)
 
         # No user or user permission required for public workspaces
         if workspace.public:
@@ -95,7 +163,7 @@ class WorkspaceChildMixin(NestedViewSetMixin):
         ).first()
 
         # If the user is at least a reader or the owner, grant access
-        if workspace_role is not None or workspace.owner == request_user:
+        if workspace_role is not None or workspace.owner_id == request_user.id:
             return child_objects
 
         # Read access denied
@@ -89,7 +89,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
     )
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def create(self, request, parent_lookup_workspace__name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         edge_table: Table = get_object_or_404(
             Table, workspace=workspace, name=request.data.get('edge_table')
         )
@@ -124,7 +124,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
     @action(detail=False, methods=['POST'])
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def from_tables(self, request, parent_lookup_workspace__name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
 
         serializer = CSVNetworkCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -139,7 +139,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
 
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def destroy(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
         network.delete()
 
@@ -154,7 +154,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
     def nodes(self, request, parent_lookup_workspace__name: str, name: str):
         # Doesn't use the Network.nodes method, in order to do proper pagination.
 
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
 
         pagination = ArangoPagination()
@@ -172,7 +172,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
     def edges(self, request, parent_lookup_workspace__name: str, name: str):
         # Doesn't use the Network.edges method, in order to do proper pagination.
 
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
 
         pagination = ArangoPagination()
@@ -188,7 +188,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
     @action(detail=True, url_path='tables')
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def tables(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
 
         serializer = NetworkTablesSerializer(data=request.query_params)
@@ -212,7 +212,7 @@ class NetworkViewSet(WorkspaceChildMixin, DetailSerializerMixin, ReadOnlyModelVi
     @action(detail=True, url_path='sessions')
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def sessions(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         network: Network = get_object_or_404(Network, workspace=workspace, name=name)
 
         sessions = NetworkSession.objects.filter(network=network.id)
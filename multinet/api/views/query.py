@@ -26,7 +26,7 @@ class AqlQueryViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def create(self, request, parent_lookup_workspace__name: str):
         """Create an AQL query task."""
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         serializer = AqlQuerySerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         query: AqlQuery = AqlQuery.objects.create(
@@ -43,7 +43,7 @@ class AqlQueryViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @action(detail=True, url_path='results')
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def results(self, request, parent_lookup_workspace__name: str, pk):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         aql_task: AqlQuery = get_object_or_404(AqlQuery, workspace=workspace, pk=pk)
         if aql_task.status == AqlQuery.Status.FINISHED:
             return Response(AqlQueryResultsSerializer(aql_task).data, status=status.HTTP_200_OK)
@@ -70,11 +70,27 @@ class PermissionsCreateSerializer(serializers.Serializer):
     readers = UserSerializer(many=True)
 
 
+class RoleUsersSerializer(serializers.ListSerializer):
+    """
+    Serialize the users with a role on a workspace.
+
+    The users may be provided through the 'roles' context, keyed by field name, e.g. by an
+    endpoint which has just set them, in which case they're used instead of querying the workspace.
+    """
+
+    def get_attribute(self, instance):
+        roles = self.context.get('roles')
+        if roles is not None and self.field_name in roles:
+            return roles[self.field_name]
+
+        return super().get_attribute(instance)
+
+
 class PermissionsReturnSerializer(serializers.ModelSerializer):
     owner = UserDetailSerializer()
-    maintainers = UserDetailSerializer(many=True)
-    writers = UserDetailSerializer(many=True)
-    readers = UserDetailSerializer(many=True)
+    maintainers = RoleUsersSerializer(child=UserDetailSerializer())
+    writers = RoleUsersSerializer(child=UserDetailSerializer())
+    readers = RoleUsersSerializer(child=UserDetailSerializer())
 
     class Meta:
         model = Workspace
@@ -120,8 +136,18 @@ class AqlQueryResultsSerializer(serializers.ModelSerializer):
 
 
 class LimitOffsetSerializer(serializers.Serializer):
-    limit = serializers.IntegerField(required=False)
-    offset = serializers.IntegerField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1)
+    offset = serializers.IntegerField(required=False, min_value=0)
+
+
+# Used for synchronous AQL queries, where the page is applied to the query in arango
+class PaginatedAqlQuerySerializer(AqlQuerySerializer, LimitOffsetSerializer):
+    def validate(self, data):
+        # A page is only applied along with its size, so an offset alone would be ignored
+        if 'offset' in data and 'limit' not in data:
+            raise serializers.ValidationError({'offset': 'An offset requires a limit.'})
+
+        return data
 
 
 class PaginatedResultSerializer(serializers.Serializer):
@@ -1,5 +1,4 @@
 from django.http.response import Http404, HttpResponseBadRequest, HttpResponseForbidden
-from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
 from rest_framework.decorators import action
@@ -35,7 +34,7 @@ class SessionViewSet(RetrieveModelMixin, DestroyModelMixin, ListModelMixin, Gene
     def state(self, request, parent_lookup_workspace__name: str, pk=None):
         session = self.get_object()
 
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         session_ws = (
             session.table.workspace if hasattr(session, 'table') else session.network.workspace
         )
@@ -64,7 +63,7 @@ class SessionViewSet(RetrieveModelMixin, DestroyModelMixin, ListModelMixin, Gene
     def set_name(self, request, parent_lookup_workspace__name: str, pk=None):
         session = self.get_object()
 
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         session_ws = (
             session.table.workspace if hasattr(session, 'table') else session.network.workspace
         )
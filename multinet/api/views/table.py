@@ -63,7 +63,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     )
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def create(self, request, parent_lookup_workspace__name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         serializer = TableSerializer(
             data={
                 **request.data,
@@ -72,20 +72,17 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        table, created = Table.objects.get_or_create(
+        table, _ = Table.objects.get_or_create(
             name=serializer.validated_data['name'],
             edge=serializer.validated_data['edge'],
             workspace=workspace,
         )
 
-        if created:
-            table.save()
-
         return Response(TableReturnSerializer(table).data, status=status.HTTP_200_OK)
 
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def destroy(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
         table.delete()
 
@@ -98,7 +95,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @action(detail=True, url_path='rows')
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def get_rows(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
         pagination = ArangoPagination()
         query = ArangoQuery.from_collections(workspace.get_arango_db(), [table.name])
@@ -122,7 +119,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @get_rows.mapping.put
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def put_rows(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
 
         insert_res = table.put_rows(request.data)
@@ -138,7 +135,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @get_rows.mapping.delete
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def delete_rows(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
 
         delete_res = table.delete_rows(request.data)
@@ -153,7 +150,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @action(detail=True, url_path='annotations')
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def get_type_annotations(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
 
         annotations = TableTypeAnnotation.objects.all().filter(table=table)
@@ -166,7 +163,7 @@ class TableViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @action(detail=True, url_path='sessions')
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def sessions(self, request, parent_lookup_workspace__name: str, name: str):
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         table: Table = get_object_or_404(Table, workspace=workspace, name=name)
 
         sessions = TableSession.objects.filter(table=table.id)
@@ -1,7 +1,6 @@
 from typing import Dict, Optional
 
 from django.core import signing
-from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
 from rest_framework.decorators import action
@@ -57,7 +56,7 @@ class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def upload_csv(self, request, parent_lookup_workspace__name: str):
         """Create an upload of a CSV file."""
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         serializer = CSVUploadCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -105,7 +104,7 @@ class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def upload_json_table(self, request, parent_lookup_workspace__name: str):
         """Create an upload of a JSON table."""
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         serializer = JSONTableUploadCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -151,7 +150,7 @@ class UploadViewSet(WorkspaceChildMixin, ReadOnlyModelViewSet):
     @require_workspace_permission(WorkspaceRoleChoice.WRITER)
     def upload_json_network(self, request, parent_lookup_workspace__name: str):
         """Create an upload of a JSON network file."""
-        workspace: Workspace = get_object_or_404(Workspace, name=parent_lookup_workspace__name)
+        workspace: Workspace = request.workspace
         serializer = JSONNetworkUploadCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -1,10 +1,11 @@
-from typing import OrderedDict
+from typing import List, OrderedDict
 
 from arango.cursor import Cursor
 from arango.exceptions import AQLQueryExecuteError, ArangoServerError
 from django.contrib.auth.models import User
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import Http404
 from django_filters import rest_framework as filters
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -17,7 +18,7 @@ from multinet.api.auth.decorators import require_workspace_ownership, require_wo
 from multinet.api.models import Workspace, WorkspaceRole, WorkspaceRoleChoice
 from multinet.api.utils.arango import ArangoQuery
 from multinet.api.views.serializers import (
-    AqlQuerySerializer,
+    PaginatedAqlQuerySerializer,
     PermissionsCreateSerializer,
     PermissionsReturnSerializer,
     SingleUserWorkspacePermissionSerializer,
@@ -26,26 +27,30 @@ from multinet.api.views.serializers import (
     WorkspaceSerializer,
 )
 
-from .common import MultinetPagination
+from .common import STREAM_CURSOR_TTL_SECS, MultinetPagination, stream_cursor
 
 
-def build_user_list(validated_data: OrderedDict) -> list:
+def build_user_lists(*validated_data: OrderedDict) -> List[list]:
     """
-    Build a list of user objects from an ordered dictionary of user data.
+    Build lists of user objects from ordered dictionaries of user data.
 
-    Accepts an ordered dictionary containing a list of validated user data, e.g.
-    as a result of validating a PermissionsSerializer with request data.
-    Returns a list of user objects.
+    Accepts any number of ordered dictionaries, each containing a list of validated user data,
+    e.g. as a result of validating a PermissionsSerializer with request data.
+    Returns a list of user objects for each, looking up all users in a single query.
     """
-    user_list = []
-    for valid_user in validated_data:
-        user_object = get_object_or_404(User, username=valid_user['username'])
-        user_list.append(user_object)
-    return user_list
+    usernames = {valid_user['username'] for user_data in validated_data for valid_user in user_data}
+    users = User.objects.in_bulk(usernames, field_name='username')
+    if len(users) != len(usernames):
+        raise Http404('No User matches the given query.')
+
+    return [
+        [users[valid_user['username']] for valid_user in user_data] for user_data in validated_data
+    ]
 
 
 class WorkspaceViewSet(ReadOnlyModelViewSet):
-    queryset = Workspace.objects.select_related('owner').all()
+    # The workspace serializer includes neither the owner nor the roles, so neither is loaded
+    queryset = Workspace.objects.all()
     lookup_field = 'name'
 
     permission_classes = [IsAuthenticatedOrReadOnly]
@@ -66,14 +71,7 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
         Filter the queryset on a per-request basis to include only public workspaces
         and those workspaces for which the request user has at least reader access.
         """
-        readable_private_workspaces = Q(
-            workspacerole__in=WorkspaceRole.objects.filter(user__id=self.request.user.id)
-        )
-        owned_workspaces = Q(owner__id=self.request.user.id)
-        public_workspaces = Q(public=True)
-        return self.queryset.filter(
-            public_workspaces | readable_private_workspaces | owned_workspaces
-        ).distinct()
+        return self.queryset.visible_to(self.request.user)
 
     @swagger_auto_schema(
         request_body=WorkspaceCreateSerializer(),
@@ -85,12 +83,10 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
 
         is_public = serializer.validated_data.get('public', False)
 
-        workspace, created = Workspace.objects.get_or_create(
+        workspace, _ = Workspace.objects.get_or_create(
             name=serializer.validated_data['name'], public=is_public, owner=request.user
         )
 
-        if created:
-            workspace.save()
         return Response(WorkspaceSerializer(workspace).data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
@@ -99,18 +95,18 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
     )
     @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER)
     def update(self, request, name):
-        workspace: Workspace = get_object_or_404(Workspace, name=name)
+        workspace: Workspace = request.workspace
         serializer = WorkspaceRenameSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         workspace.name = serializer.validated_data['name']
-        workspace.save()
+        workspace.save(update_fields=['name', 'modified'])
 
         return Response(WorkspaceSerializer(workspace).data, status=status.HTTP_200_OK)
 
     @require_workspace_ownership
     def destroy(self, request, name):
-        workspace: Workspace = get_object_or_404(Workspace, name=name)
+        workspace: Workspace = request.workspace
         workspace.delete()
         return Response(None, status=status.HTTP_204_NO_CONTENT)
 
@@ -125,7 +121,10 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
         Note that get_permissions is not allowed as a function name, since it
         is already in use by the framework.
         """
-        workspace: Workspace = get_object_or_404(Workspace, name=name)
+        workspace: Workspace = request.workspace
+        # Fetch all roles of the workspace, along with their users, in a single query
+        roles = Prefetch('workspacerole_set', queryset=WorkspaceRole.objects.select_related('user'))
+        prefetch_related_objects([workspace], 'owner', roles)
         serializer = PermissionsReturnSerializer(workspace)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -134,9 +133,11 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def get_current_user_workspace_permissions(self, request, name: str):
         """Get the workspace permission for the user of the request."""
-        workspace: Workspace = get_object_or_404(Workspace, name=name)
+        workspace: Workspace = request.workspace
         user = request.user
-        permission, permission_label = workspace.get_user_permission_tuple(user)
+        permission, permission_label = workspace.build_user_permission_tuple(
+            user, workspace._user_role
+        )
         data = {
             'username': user.username,
             'workspace': name,
@@ -155,39 +156,65 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
     @require_workspace_permission(WorkspaceRoleChoice.MAINTAINER)
     def put_workspace_permissions(self, request, name: str):
         """Update existing workspace permissions."""
-        workspace: Workspace = get_object_or_404(Workspace, name=name)
+        workspace: Workspace = request.workspace
         serializer = PermissionsCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        # maintainers and owners can make changes to all of this data
-        workspace.public = validated_data['public']
-        workspace.save()
-
-        new_readers = build_user_list(validated_data['readers'])
-        new_writers = build_user_list(validated_data['writers'])
-        new_maintainers = build_user_list(validated_data['maintainers'])
-        workspace.set_user_permissions_bulk(
-            readers=new_readers, writers=new_writers, maintainers=new_maintainers
+        # Only the owner may transfer ownership, in which case the new owner is
+        # looked up in the same query as the other users
+        owner_transfer = workspace.owner_id == request.user.id
+        owner_data = [validated_data['owner']] if owner_transfer else []
+        new_readers, new_writers, new_maintainers, new_owners = build_user_lists(
+            validated_data['readers'],
+            validated_data['writers'],
+            validated_data['maintainers'],
+            owner_data,
         )
+        roles = {'readers': new_readers, 'writers': new_writers, 'maintainers': new_maintainers}
+
+        # Apply all changes in one transaction, so that they either all succeed or all fail
+        with transaction.atomic():
+            # maintainers and owners can make changes to all of this data
+            workspace.public = validated_data['public']
+            workspace.save(update_fields=['public', 'modified'])
+
+            workspace.set_user_permissions_bulk(
+                readers=new_readers, writers=new_writers, maintainers=new_maintainers
+            )
 
-        if workspace.owner == request.user:
-            new_owner_name = validated_data['owner']['username']
-            new_owner = get_object_or_404(User, username=new_owner_name)
-            workspace.set_owner(new_owner)
+            if owner_transfer:
+                new_owner = new_owners[0]
+                workspace.set_owner(new_owner)
 
-        return Response(PermissionsReturnSerializer(workspace).data, status=status.HTTP_200_OK)
+                # Any role held by the new owner is removed by set_owner
+                roles = {
+                    field: [u for u in users if u != new_owner] for field, users in roles.items()
+                }
 
-    @swagger_auto_schema(request_body=AqlQuerySerializer())
+        # Serialize the roles just set, instead of reading them back from the database
+        serializer = PermissionsReturnSerializer(workspace, context={'roles': roles})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        request_body=PaginatedAqlQuerySerializer(),
+        operation_description=(
+            'Execute AQL in a workspace.\n\n'
+            'The results are streamed as a JSON array while they are read from the database. '
+            f'If the client stops reading for more than {STREAM_CURSOR_TTL_SECS} seconds, the '
+            'query expires and the array is cut short, so large results should be paged with '
+            '`limit` and `offset`.'
+        ),
+    )
     @action(detail=True, methods=['POST'])
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def aql(self, request, name: str):
         """Execute AQL in a workspace."""
-        serializer = AqlQuerySerializer(data=request.data)
+        serializer = PaginatedAqlQuerySerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         # Retrieve workspace and db
-        workspace: Workspace = get_object_or_404(Workspace, name=name)
+        workspace: Workspace = request.workspace
         database = workspace.get_arango_db()
 
         # Form query
@@ -195,12 +222,14 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
         bind_vars = serializer.validated_data['bind_vars']
         query = ArangoQuery(database, query_str=query_str, bind_vars=bind_vars)
 
+        # Only return the requested page of results, if one was requested
+        limit = serializer.validated_data.get('limit')
+        if limit is not None:
+            query = query.paginate(limit, serializer.validated_data.get('offset', 0))
+
         try:
-            cursor: Cursor = query.execute()
-            return Response(
-                cursor,
-                status=status.HTTP_200_OK,
-            )
+            cursor: Cursor = query.execute(ttl=STREAM_CURSOR_TTL_SECS)
+            return stream_cursor(cursor, status=status.HTTP_200_OK)
         except AQLQueryExecuteError as err:
             # Invalid query, time/memory limit reached, or
             # attempt to run a mutating query as the readonly user
@@ -215,11 +244,10 @@ class WorkspaceViewSet(ReadOnlyModelViewSet):
     @action(detail=True, methods=['GET'])
     @require_workspace_permission(WorkspaceRoleChoice.READER)
     def network_build_requests(self, request, name: str):
-        # Use the workspace parameter in your code
-        workspace_obj: Workspace = Workspace.objects.get(name=name)
+        workspace: Workspace = request.workspace
 
         # Needs root access since root is making the AQL query job
-        db = workspace_obj.get_arango_db(readonly=False)
+        db = workspace.get_arango_db(readonly=False)
         jobs = db.async_jobs('pending')
 
         return Response(data=jobs, status=status.HTTP_200_OK)
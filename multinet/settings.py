@@ -34,9 +34,7 @@ class MultinetMixin(ConfigMixin):
 
     @staticmethod
     def before_binding(configuration: ComposedConfiguration) -> None:
-        configuration.INSTALLED_APPS = [
-            'multinet.api.apps.ApiConfig',
-        ] + configuration.INSTALLED_APPS
+        configuration.INSTALLED_APPS.insert(0, 'multinet.api.apps.ApiConfig')
 
         configuration.INSTALLED_APPS += [
             's3_file_field',
@@ -22,43 +22,20 @@ from multinet.api.views import (
 
 router = ExtendedSimpleRouter()
 workspaces_routes = router.register('workspaces', WorkspaceViewSet)
-workspaces_routes.register(
-    'tables',
-    TableViewSet,
-    basename='table',
-    parents_query_lookups=[f'workspace__{WorkspaceViewSet.lookup_field}'],
-)
-workspaces_routes.register(
-    'networks',
-    NetworkViewSet,
-    basename='network',
-    parents_query_lookups=[f'workspace__{WorkspaceViewSet.lookup_field}'],
-)
-workspaces_routes.register(
-    'uploads',
-    UploadViewSet,
-    basename='upload',
-    parents_query_lookups=[f'workspace__{WorkspaceViewSet.lookup_field}'],
-)
-workspaces_routes.register(
-    'queries',
-    AqlQueryViewSet,
-    basename='query',
-    parents_query_lookups=[f'workspace__{WorkspaceViewSet.lookup_field}'],
-)
 
-workspaces_routes.register(
-    'sessions/network',
-    NetworkSessionViewSet,
-    basename='session',
-    parents_query_lookups=[f'workspace__{WorkspaceViewSet.lookup_field}'],
-)
-workspaces_routes.register(
-    'sessions/table',
-    TableSessionViewSet,
-    basename='session',
-    parents_query_lookups=[f'workspace__{WorkspaceViewSet.lookup_field}'],
-)
+# All of these routes are nested under a workspace, looked up by its name
+_PARENT_LOOKUPS = [f'workspace__{WorkspaceViewSet.lookup_field}']
+for prefix, viewset, basename in (
+    ('tables', TableViewSet, 'table'),
+    ('networks', NetworkViewSet, 'network'),
+    ('uploads', UploadViewSet, 'upload'),
+    ('queries', AqlQueryViewSet, 'query'),
+    ('sessions/network', NetworkSessionViewSet, 'session'),
+    ('sessions/table', TableSessionViewSet, 'session'),
+):
+    workspaces_routes.register(
+        prefix, viewset, basename=basename, parents_query_lookups=_PARENT_LOOKUPS
+    )
 
 # OpenAPI generation
 schema_view = get_schema_view(
@@ -67,6 +44,9 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# The schema only changes on deploy, so avoid regenerating it from every viewset on each request
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+
 urlpatterns = [
     # Override allauth login and signup to use Google OAuth2
     path('accounts/login/', RedirectView.as_view(url='/accounts/google/login/')),
@@ -79,8 +59,16 @@ urlpatterns = [
     path('api/alttxt/', UpsetAltTextGenerate.as_view()),
     path('api/users/me', users_me_view),
     path('api/users/search', users_search_view),
-    path('api/docs/redoc/', schema_view.with_ui('redoc'), name='docs-redoc'),
-    path('swagger/', schema_view.with_ui('swagger'), name='docs-swagger'),
+    path(
+        'api/docs/redoc/',
+        schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT),
+        name='docs-redoc',
+    ),
+    path(
+        'swagger/',
+        schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT),
+        name='docs-swagger',
+    ),
 ]
 
 if settings.DEBUG: